@@ -5,6 +5,16 @@ from .utils import NAME_TO_BUILTIN
 
 
 class CascadeNamespace(ABC):
+    @property
+    @abstractmethod
+    def constants(self) -> Mapping[str, object]:
+        ...
+
+    @property
+    @abstractmethod
+    def outer_constants(self) -> Mapping[str, object]:
+        ...
+
     @abstractmethod
     def add_constant(self, name: str, value: object) -> None:
         ...
@@ -13,6 +23,14 @@ class CascadeNamespace(ABC):
     def try_add_constant(self, name: str, value: object) -> bool:
         ...
 
+    @abstractmethod
+    def add_outer_constant(self, name: str, value: object) -> None:
+        ...
+
+    @abstractmethod
+    def try_add_outer_constant(self, name: str, value: object) -> bool:
+        ...
+
     @abstractmethod
     def register_var(self, name: str) -> None:
         ...
@@ -87,5 +105,9 @@ class BuiltinCascadeNamespace(CascadeNamespace):
             raise KeyError(f"Key {name} is duplicated")
 
     @property
-    def all_constants(self) -> Mapping[str, object]:
-        return {**self._constants, **self._outer_constants}
+    def constants(self) -> Mapping[str, object]:
+        return self._constants
+
+    @property
+    def outer_constants(self) -> Mapping[str, object]:
+        return self._outer_constants
@@ -1,3 +1,4 @@
+import ast
 import linecache
 from abc import ABC, abstractmethod
 from collections import defaultdict
@@ -17,12 +18,14 @@ class ClosureCompiler(ABC):
         filename_maker: Callable[[str], str],
         builder: CodeBuilder,
         namespace: Dict[str, Any],
+        closure_name: str,
     ) -> Callable:
-        """Execute content of builder and return value that body returned (it is must be a closure).
+        """Execute content of builder and return closure defined there.
         :param base_id: string that used to generate unique id
         :param filename_maker: function taking unique id and returning full filename
-        :param builder: Builder containing the body of function that creates closure
+        :param builder: Builder containing statements defining the closure
         :param namespace: Global variables
+        :param closure_name: Name of closure defined at builder
         :return: closure object
         """
 
@@ -45,17 +48,21 @@ _counter = ConcurrentCounter()
 
 
 class BasicClosureCompiler(ClosureCompiler):
-    def _make_source_builder(self, builder: CodeBuilder) -> CodeBuilder:
-        main_builder = CodeBuilder()
-
-        main_builder += "def _closure_maker():"
-        with main_builder:
-            main_builder.extend(builder)
-
-        return main_builder
+    def _make_closure_maker_ast(self, source: str, closure_name: str) -> ast.Module:
+        # Building the wrapping function at ast level
+        # saves from re-indenting the whole source
+        # and keeps line numbers matching the source placed at linecache
+        body_module = ast.parse(source)
+        closure_maker = ast.FunctionDef(
+            name="_closure_maker",
+            args=ast.arguments(posonlyargs=[], args=[], kwonlyargs=[], kw_defaults=[], defaults=[]),
+            body=[*body_module.body, ast.Return(value=ast.Name(id=closure_name, ctx=ast.Load()))],
+            decorator_list=[],
+        )
+        return ast.fix_missing_locations(ast.Module(body=[closure_maker], type_ignores=[]))
 
-    def _compile(self, source: str, unique_filename: str, namespace: Dict[str, Any]):
-        code_obj = compile(source, unique_filename, "exec")
+    def _compile(self, source: str, unique_filename: str, namespace: Dict[str, Any], closure_name: str):
+        code_obj = compile(self._make_closure_maker_ast(source, closure_name), unique_filename, "exec")
 
         local_namespace: Dict[str, Any] = {}
         exec(code_obj, namespace, local_namespace)  # noqa: S102
@@ -79,7 +86,8 @@ class BasicClosureCompiler(ClosureCompiler):
         filename_maker: Callable[[str], str],
         builder: CodeBuilder,
         namespace: Dict[str, Any],
+        closure_name: str,
     ) -> Callable:
-        source = self._make_source_builder(builder).string()
+        source = builder.string()
         unique_id = self._get_unique_id(base_id)
-        return self._compile(source, filename_maker(unique_id), namespace)
+        return self._compile(source, filename_maker(unique_id), namespace, closure_name)
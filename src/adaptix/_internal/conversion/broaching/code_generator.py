@@ -4,7 +4,7 @@ from abc import ABC, abstractmethod
 from ast import AST
 from collections import defaultdict
 from inspect import Signature
-from typing import DefaultDict, Mapping, Tuple, Union
+from typing import DefaultDict, Tuple, Union
 
 from ...code_tools.ast_templater import ast_substitute
 from ...code_tools.cascade_namespace import BuiltinCascadeNamespace, CascadeNamespace
@@ -59,7 +59,7 @@ class GenState:
 
 class BroachingCodeGenerator(ABC):
     @abstractmethod
-    def produce_code(self, signature: Signature, closure_name: str) -> Tuple[str, Mapping[str, object]]:
+    def produce_code(self, signature: Signature, closure_name: str) -> Tuple[str, CascadeNamespace]:
         ...
 
 
@@ -74,7 +74,7 @@ class BuiltinBroachingCodeGenerator(BroachingCodeGenerator):
             name_sanitizer=self._name_sanitizer,
         )
 
-    def produce_code(self, signature: Signature, closure_name: str) -> Tuple[str, Mapping[str, object]]:
+    def produce_code(self, signature: Signature, closure_name: str) -> Tuple[str, CascadeNamespace]:
         builder = CodeBuilder()
         namespace = BuiltinCascadeNamespace(occupied=signature.parameters.keys())
         state = self._create_state(namespace=namespace)
@@ -90,7 +90,7 @@ class BuiltinBroachingCodeGenerator(BroachingCodeGenerator):
 
         builder += f"{closure_name}.__signature__ = _closure_signature"
         builder += f"{closure_name}.__name__ = {closure_name!r}"
-        return builder.string(), namespace.all_constants
+        return builder.string(), namespace
 
     def _gen_plan_element_dispatch(self, state: GenState, element: BroachingPlan) -> AST:
         if isinstance(element, ParameterElement):
@@ -1,7 +1,7 @@
 import itertools
 from functools import update_wrapper
 from inspect import Parameter, Signature
-from typing import Any, Callable, Mapping, Optional, Sequence, Tuple
+from typing import Any, Callable, Optional, Sequence, Tuple
 
 from ..code_tools.cascade_namespace import BuiltinCascadeNamespace, CascadeNamespace
 from ..code_tools.code_builder import CodeBuilder
@@ -9,7 +9,7 @@ from ..code_tools.compiler import BasicClosureCompiler, ClosureCompiler
 from ..code_tools.name_sanitizer import BuiltinNameSanitizer, NameSanitizer
 from ..common import Coercer, Converter, TypeHint
 from ..conversion.request_cls import CoercerRequest, ConversionContext, ConverterRequest
-from ..model_tools.definitions import DefaultValue, NoDefault
+from ..model_tools.definitions import NO_DEFAULT, DefaultValue
 from ..morphing.model.basic_gen import compile_closure_with_globals_capturing, fetch_code_gen_hook
 from ..provider.essential import CannotProvide, Mediator
 from ..provider.location import FieldLoc
@@ -84,7 +84,7 @@ class BuiltinConverterProvider(ConverterProvider):
         stub_function: Optional[Callable],
         closure_name: str,
         coercer: Coercer,
-    ) -> Tuple[str, Mapping[str, object]]:
+    ) -> Tuple[str, CascadeNamespace]:
         builder = CodeBuilder()
         namespace = BuiltinCascadeNamespace(occupied=signature.parameters.keys())
         namespace.add_outer_constant("_closure_signature", signature)
@@ -108,7 +108,7 @@ class BuiltinConverterProvider(ConverterProvider):
             builder += f"_update_wrapper({closure_name}, _stub_function)"
         builder += f"{closure_name}.__signature__ = _closure_signature"
         builder += f"{closure_name}.__name__ = {closure_name!r}"
-        return builder.string(), namespace.all_constants
+        return builder.string(), namespace
 
     def _get_ctx_passing(self, ctx_parameters: Sequence[Parameter]) -> str:
         if len(ctx_parameters) == 0:
@@ -147,7 +147,7 @@ class BuiltinConverterProvider(ConverterProvider):
         return FieldLoc(
             field_id=parameter.name,
             type=self._get_type_from_annotation(parameter.annotation),
-            default=NoDefault() if parameter.default == Signature.empty else DefaultValue(parameter.default),
+            default=NO_DEFAULT if parameter.default == Signature.empty else DefaultValue(parameter.default),
             metadata={},
         )
 
@@ -1,26 +1,35 @@
 import ast
 import inspect
+from functools import lru_cache
 from textwrap import dedent
 
 
-def ensure_function_is_stub(func):
-    try:
-        raw_source = inspect.getsource(func)
-    except OSError:
-        return
-
-    source = dedent(raw_source)
+@lru_cache(maxsize=128)
+def _is_stub_source(source: str) -> bool:
     try:
         ast_module = ast.parse(source)
     except SyntaxError:
-        return
-    func_body = ast_module.body[0].body
+        return True
+    func_def = ast_module.body[0]
+    if not isinstance(func_def, (ast.FunctionDef, ast.AsyncFunctionDef)):
+        return False
+    func_body = func_def.body
     if len(func_body) == 1:
         body_element = func_body[0]
         if isinstance(body_element, ast.Pass):
-            return
+            return True
         if isinstance(body_element, ast.Expr) and isinstance(body_element.value, ast.Constant):
             value = body_element.value.value
             if value == Ellipsis or isinstance(value, str):
-                return
-    raise ValueError("Body of function must be empty")
+                return True
+    return False
+
+
+def ensure_function_is_stub(func):
+    try:
+        raw_source = inspect.getsource(func)
+    except OSError:
+        return
+
+    if not _is_stub_source(dedent(raw_source)):
+        raise ValueError("Body of function must be empty")
@@ -1,21 +1,49 @@
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, FrozenSet, Generic, Hashable, Mapping, Optional, TypeVar, Union
+from functools import lru_cache, partial
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any, Callable, FrozenSet, Generic, Hashable, Mapping, Optional, Type, TypeVar, Union
 
 from ..common import Catchable, TypeHint, VarTuple
-from ..feature_requirement import DistributionRequirement, DistributionVersionRequirement
+from ..feature_requirement import HAS_PY_310, DistributionRequirement, DistributionVersionRequirement
 from ..struct_trail import Attr, TrailElement
 from ..utils import SingletonMeta, pairs
 
 S = TypeVar("S")
 T = TypeVar("T")
 
+if TYPE_CHECKING:
+    from typing_extensions import dataclass_transform
+
+    # mypy does not look through functools.partial,
+    # so the decorator is exposed to it as a plain dataclass transform
+    @dataclass_transform(frozen_default=True, field_specifiers=(field,))
+    def _model_dataclass(cls: Type[T]) -> Type[T]:
+        ...
+elif HAS_PY_310:
+    # fields and shapes are created per model field and live as long as
+    # the compiled loader, slots halve their memory and speed up attribute reads;
+    # manual __slots__ cannot be used because dataclass field() assignments
+    # would conflict with the slot descriptors
+    _model_dataclass = partial(dataclass, frozen=True, slots=True)
+else:
+    _model_dataclass = partial(dataclass, frozen=True)
+
+# shared by every field that carries no metadata,
+# saving a proxy plus a dict allocation per field
+EMPTY_METADATA: Mapping[Any, Any] = MappingProxyType({})
+
 
 class NoDefault(metaclass=SingletonMeta):
     pass
 
 
+# the singleton is hoisted so hot paths can dispatch on identity
+# without paying for the metaclass call of NoDefault()
+NO_DEFAULT = NoDefault()
+
+
 @dataclass(frozen=True)
 class DefaultValue(Generic[T]):
     value: T
@@ -130,6 +158,10 @@ class ItemAccessor(Accessor):
         )
 
 
+# both factories are pure constructors over a small set of hashable
+# arguments and accessors are immutable, so repeated shape builds
+# share one instance per distinct (name, error) pair
+@lru_cache(maxsize=None)
 def create_attr_accessor(attr_name: str, *, is_required: bool) -> DescriptorAccessor:
     return DescriptorAccessor(
         attr_name=attr_name,
@@ -137,6 +169,7 @@ def create_attr_accessor(attr_name: str, *, is_required: bool) -> DescriptorAcce
     )
 
 
+@lru_cache(maxsize=None)
 def create_key_accessor(key: Union[str, int], access_error: Optional[Catchable]) -> ItemAccessor:
     return ItemAccessor(
         key=key,
@@ -149,7 +182,7 @@ def is_valid_field_id(value: str) -> bool:
     return value.isidentifier()
 
 
-@dataclass(frozen=True)
+@_model_dataclass
 class BaseField:
     id: str
     type: TypeHint
@@ -165,7 +198,7 @@ class BaseField:
             raise ValueError(f"Field id must be python identifier, now it is a {self.id!r}")
 
 
-@dataclass(frozen=True)
+@_model_dataclass
 class InputField(BaseField):
     is_required: bool
 
@@ -174,7 +207,7 @@ class InputField(BaseField):
         return not self.is_required
 
 
-@dataclass(frozen=True)
+@_model_dataclass
 class OutputField(BaseField):
     accessor: Accessor
 
@@ -187,7 +220,7 @@ class OutputField(BaseField):
         return self.accessor.access_error is None
 
 
-@dataclass(frozen=True)
+@_model_dataclass
 class BaseShape:
     """Signature of class, it is divided into two parts: input and output.
     See doc :class InputShape: and :class OutputShape: for more details
@@ -210,7 +243,9 @@ class BaseShape:
             raise ValueError(f"overriden_types contains non existing fields {wild_overriden_types}")
 
     def __post_init__(self):
-        super().__setattr__("fields_dict", {fld.id: fld for fld in self.fields})
+        # zero-argument super() cannot be used here:
+        # slots=True recreates the class, leaving the __class__ cell stale
+        object.__setattr__(self, "fields_dict", {fld.id: fld for fld in self.fields})
         self._validate()
 
 
@@ -223,7 +258,7 @@ class ParamKind(Enum):
         return f"{type(self).__name__}.{self.name}"
 
 
-@dataclass(frozen=True)
+@_model_dataclass
 class Param:
     field_id: str
     name: str
@@ -239,12 +274,12 @@ class Param:
         self._validate()
 
 
-@dataclass(frozen=True)
+@_model_dataclass
 class ParamKwargs:
     type: TypeHint
 
 
-@dataclass(frozen=True)
+@_model_dataclass
 class InputShape(BaseShape, Generic[T]):
     """Description of desired object creation
 
@@ -262,7 +297,7 @@ class InputShape(BaseShape, Generic[T]):
         return self.kwargs is not None
 
     def _validate(self):
-        super()._validate()
+        BaseShape._validate(self)
 
         param_names = {param.name for param in self.params}
         if len(param_names) != len(self.params):
@@ -301,7 +336,7 @@ class InputShape(BaseShape, Generic[T]):
                 raise ValueError(f"Field {param.field_id!r} can not be positional only and optional")
 
 
-@dataclass(frozen=True)
+@_model_dataclass
 class OutputShape(BaseShape):
     """Description of extraction data from an object
 
@@ -315,7 +350,7 @@ Inp = TypeVar("Inp", bound=Optional[InputShape])
 Out = TypeVar("Out", bound=Optional[OutputShape])
 
 
-@dataclass(frozen=True)
+@_model_dataclass
 class Shape(Generic[Inp, Out]):
     input: Inp
     output: Out
@@ -3,6 +3,7 @@ from typing import Any
 from ...feature_requirement import HAS_ATTRS_PKG, HAS_SUPPORTED_ATTRS_PKG
 from ...type_tools import get_all_type_hints
 from ..definitions import (
+    NO_DEFAULT,
     Default,
     DefaultFactory,
     DefaultFactoryWithSelf,
@@ -11,7 +12,6 @@ from ..definitions import (
     InputField,
     InputShape,
     IntrospectionError,
-    NoDefault,
     NoTargetPackageError,
     OutputField,
     OutputShape,
@@ -37,7 +37,7 @@ def _get_default(attrs_field) -> Default:
         return DefaultFactory(default.factory)
 
     if default is attrs.NOTHING:
-        return NoDefault()
+        return NO_DEFAULT
 
     return DefaultValue(default)
 
@@ -67,7 +67,7 @@ def _get_input_shape(tp, attrs_fields, type_hints) -> InputShape:
             default=_get_default(attrs_fld),
             metadata=attrs_fld.metadata,
             original=attrs_fld,
-            is_required=_get_default(attrs_fld) == NoDefault(),
+            is_required=_get_default(attrs_fld) is NO_DEFAULT,
         )
         for attrs_fld in attrs_fields
         if attrs_fld.init
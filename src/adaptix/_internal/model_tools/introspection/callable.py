@@ -1,18 +1,18 @@
 import inspect
 import typing
 from inspect import Parameter, Signature
-from types import MappingProxyType
 from typing import Any, Dict, Optional, Tuple
 
 from ...common import VarTuple
 from ...feature_requirement import HAS_PY_312
 from ...type_tools import get_all_type_hints, normalize_type
 from ..definitions import (
+    EMPTY_METADATA,
+    NO_DEFAULT,
     DefaultValue,
     InputField,
     InputShape,
     IntrospectionError,
-    NoDefault,
     Param,
     ParamKind,
     ParamKwargs,
@@ -88,8 +88,8 @@ def get_callable_shape(func, params_slice=slice(0, None)) -> Shape[InputShape, N
                     type=type_hints.get(param.name, Any),
                     id=param.name,
                     is_required=_is_empty(param.default) or param.kind == Parameter.POSITIONAL_ONLY,
-                    default=NoDefault() if _is_empty(param.default) else DefaultValue(param.default),
-                    metadata=MappingProxyType({}),
+                    default=NO_DEFAULT if _is_empty(param.default) else DefaultValue(param.default),
+                    metadata=EMPTY_METADATA,
                     original=param,
                 )
                 for param in params
@@ -1,10 +1,13 @@
 import inspect
+import sys
 from dataclasses import MISSING as DC_MISSING, Field as DCField, fields as dc_fields, is_dataclass
+from functools import lru_cache
 from typing import Dict
 
 from ...feature_requirement import HAS_PY_310
 from ...type_tools import get_all_type_hints, is_class_var, normalize_type
 from ..definitions import (
+    NO_DEFAULT,
     Default,
     DefaultFactory,
     DefaultValue,
@@ -12,7 +15,6 @@ from ..definitions import (
     InputField,
     InputShape,
     IntrospectionError,
-    NoDefault,
     OutputField,
     OutputShape,
     Param,
@@ -35,16 +37,17 @@ def _get_default(field: DCField) -> Default:
         return DefaultValue(field.default)
     if field.default_factory is not DC_MISSING:
         return DefaultFactory(field.default_factory)
-    return NoDefault()
+    return NO_DEFAULT
 
 
-def _create_inp_field_from_dc_field(dc_field: DCField, type_hints):
-    default = _get_default(dc_field)
+def _create_inp_field_from_dc_field(dc_field: DCField, type_hints, default: Default):
+    # names of statically defined classes are interned by the compiler,
+    # but make_dataclass accepts arbitrary strings, so normalize here
     return InputField(
         type=type_hints[dc_field.name],
-        id=dc_field.name,
+        id=sys.intern(dc_field.name),
         default=default,
-        is_required=default == NoDefault(),
+        is_required=default is NO_DEFAULT,
         metadata=dc_field.metadata,
         original=dc_field,
     )
@@ -71,21 +74,42 @@ def get_dataclass_shape(tp) -> FullShape:
 
     if not is_dataclass(tp):
         raise IntrospectionError
+    return _introspect_dataclass(tp)
 
+
+# the shape is a pure function of the class and is deeply immutable,
+# so re-introspection of the same dataclass collapses to a cache hit;
+# the shape references the class (constructor, field originals),
+# so weak keying cannot work — the cache is bounded instead
+# to keep dynamically created classes from accumulating
+@lru_cache(maxsize=128)
+def _introspect_dataclass(tp) -> FullShape:
     name_to_dc_field = all_dc_fields(tp)
     dc_fields_public = dc_fields(tp)
     init_params = list(
         inspect.signature(tp.__init__).parameters.keys(),
     )[1:]
     type_hints = get_all_type_hints(tp)
+    # defaults are classified once per field here,
+    # the input and output sides below share the result
+    name_to_default = {
+        name: _get_default(dc_field)
+        for name, dc_field in name_to_dc_field.items()
+    }
+    # dataclasses.fields already excludes ClassVar and InitVar pseudo-fields,
+    # so only names outside it need the hint normalization to tell them apart
+    public_field_names = {dc_field.name for dc_field in dc_fields_public}
 
     return Shape(
         input=InputShape(
             constructor=tp,
             fields=tuple(
-                _create_inp_field_from_dc_field(dc_field, type_hints)
+                _create_inp_field_from_dc_field(dc_field, type_hints, name_to_default[dc_field.name])
                 for dc_field in name_to_dc_field.values()
-                if dc_field.init and not is_class_var(normalize_type(type_hints[dc_field.name]))
+                if dc_field.init and (
+                    dc_field.name in public_field_names
+                    or not is_class_var(normalize_type(type_hints[dc_field.name]))
+                )
             ),
             params=tuple(
                 Param(
@@ -105,8 +129,8 @@ def get_dataclass_shape(tp) -> FullShape:
             fields=tuple(
                 OutputField(
                     type=type_hints[dc_field.name],
-                    id=dc_field.name,
-                    default=_get_default(name_to_dc_field[dc_field.name]),
+                    id=sys.intern(dc_field.name),
+                    default=name_to_default[dc_field.name],
                     accessor=create_attr_accessor(attr_name=dc_field.name, is_required=True),
                     metadata=dc_field.metadata,
                     original=dc_field,
@@ -1,14 +1,14 @@
-from types import MappingProxyType
 from typing import Any
 
 from ...type_tools import get_all_type_hints, is_named_tuple_class
 from ..definitions import (
+    EMPTY_METADATA,
+    NO_DEFAULT,
     DefaultValue,
     FullShape,
     InputField,
     InputShape,
     IntrospectionError,
-    NoDefault,
     OutputField,
     OutputShape,
     Param,
@@ -39,10 +39,10 @@ def get_named_tuple_shape(tp) -> FullShape:
                 default=(
                     DefaultValue(tp._field_defaults[field_id])
                     if field_id in tp._field_defaults else
-                    NoDefault()
+                    NO_DEFAULT
                 ),
                 is_required=field_id not in tp._field_defaults,
-                metadata=MappingProxyType({}),
+                metadata=EMPTY_METADATA,
                 original=None,
             )
             for field_id in tp._fields
@@ -17,6 +17,7 @@ from adaptix import TypeHint
 from ...feature_requirement import HAS_ANNOTATED, HAS_PYDANTIC_PKG, HAS_SUPPORTED_PYDANTIC_PKG
 from ...type_tools import get_all_type_hints, is_pydantic_class
 from ..definitions import (
+    NO_DEFAULT,
     ClarifiedIntrospectionError,
     Default,
     DefaultFactory,
@@ -25,7 +26,6 @@ from ..definitions import (
     InputField,
     InputShape,
     IntrospectionError,
-    NoDefault,
     NoTargetPackageError,
     OutputField,
     OutputShape,
@@ -47,7 +47,7 @@ def _get_default(field: WithDefaults) -> Default:
     if field.default_factory is not None:
         return DefaultFactory(field.default_factory)
     if field.default is PydanticUndefined:
-        return NoDefault()
+        return NO_DEFAULT
     return DefaultValue(field.default)
 
 
@@ -122,7 +122,7 @@ def _get_input_shape(tp: "Type[BaseModel]") -> InputShape:
                 default=_get_default(field_info),
                 metadata={},  # pydantic metadata is the list
                 original=field_info,
-                is_required=_get_default(field_info) == NoDefault(),
+                is_required=_get_default(field_info) is NO_DEFAULT,
             )
             for field_id, field_info in tp.model_fields.items()
         ),
@@ -181,7 +181,7 @@ def _get_output_shape(tp: "Type[BaseModel]") -> OutputShape:
             OutputField(
                 id=field_id,
                 type=_get_computed_field_type(field_id, computed_field_dec.info),
-                default=NoDefault(),
+                default=NO_DEFAULT,
                 metadata={},
                 original=computed_field_dec.info,
                 accessor=create_attr_accessor(field_id, is_required=True),
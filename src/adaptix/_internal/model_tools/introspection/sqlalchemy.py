@@ -22,6 +22,7 @@ except ImportError:
 from ...feature_requirement import HAS_SQLALCHEMY_PKG, HAS_SUPPORTED_SQLALCHEMY_PKG
 from ...type_tools import get_all_type_hints, get_generic_args, strip_alias
 from ..definitions import (
+    NO_DEFAULT,
     ClarifiedIntrospectionError,
     DefaultFactory,
     DefaultValue,
@@ -29,7 +30,6 @@ from ..definitions import (
     InputField,
     InputShape,
     IntrospectionError,
-    NoDefault,
     NoTargetPackageError,
     OutputField,
     OutputShape,
@@ -93,11 +93,11 @@ def _get_type_for_relationship(relationship: "RelationshipProperty", type_hints:
 def _get_default(column_default: "Optional[DefaultGenerator]"):
     if isinstance(column_default, CallableColumnDefault):
         if _is_context_sensitive(column_default):
-            return NoDefault()
+            return NO_DEFAULT
         return DefaultFactory(factory=column_default.arg.__wrapped__)  # type: ignore[attr-defined]
     if isinstance(column_default, ScalarElementColumnDefault):
         return DefaultValue(value=column_default.arg)
-    return NoDefault()
+    return NO_DEFAULT
 
 
 def _is_input_required_for_column(column: "ColumnElement", autoincrement_column: "Optional[Column[int]]"):
@@ -162,7 +162,7 @@ def _get_input_shape(
             InputField(
                 id=relationship.key,
                 type=_get_type_for_relationship(relationship, type_hints),
-                default=NoDefault(),
+                default=NO_DEFAULT,
                 is_required=False,
                 metadata={},
                 original=relationship,
@@ -212,7 +212,7 @@ def _get_output_shape(
             OutputField(
                 id=relationship.key,
                 type=_get_type_for_relationship(relationship, type_hints),
-                default=NoDefault(),
+                default=NO_DEFAULT,
                 metadata={},
                 original=relationship,
                 accessor=create_attr_accessor(relationship.key, is_required=True),
@@ -1,16 +1,18 @@
+import sys
 import typing
 import warnings
-from types import MappingProxyType
+from functools import lru_cache
 from typing import AbstractSet, Sequence, Set, Tuple
 
 from ...feature_requirement import HAS_PY_39, HAS_TYPED_DICT_REQUIRED
 from ...type_tools import BaseNormType, get_all_type_hints, is_typed_dict_class, normalize_type
 from ..definitions import (
+    EMPTY_METADATA,
+    NO_DEFAULT,
     FullShape,
     InputField,
     InputShape,
     IntrospectionError,
-    NoDefault,
     OutputField,
     OutputShape,
     Param,
@@ -33,7 +35,9 @@ class TypedDictAt38Warning(UserWarning):
 
 
 def _get_td_hints(tp):
-    elements = list(get_all_type_hints(tp).items())
+    # field names end up as dict keys in loaders and dumpers,
+    # interned strings let those lookups take the pointer-equality fast path
+    elements = [(sys.intern(name), hint) for name, hint in get_all_type_hints(tp).items()]
     elements.sort(key=lambda v: v[0])
     return elements
 
@@ -76,11 +80,20 @@ else:
 
 
 def get_typed_dict_shape(tp) -> FullShape:
-    # __annotations__ of TypedDict contain also parents' type hints unlike any other classes,
-    # so overriden_types always is empty
     if not is_typed_dict_class(tp):
         raise IntrospectionError
+    return _introspect_typed_dict(tp)
 
+
+# the shape is a pure function of the class and is deeply immutable,
+# so re-introspection of the same TypedDict collapses to a cache hit;
+# the shape references the class as constructor, so weak keying cannot
+# work — the cache is bounded instead to keep dynamically created
+# classes from accumulating
+@lru_cache(maxsize=128)
+def _introspect_typed_dict(tp) -> FullShape:
+    # __annotations__ of TypedDict contain also parents' type hints unlike any other classes,
+    # so overriden_types always is empty
     type_hints = _get_td_hints(tp)
 
     if HAS_TYPED_DICT_REQUIRED:
@@ -94,46 +107,54 @@ def get_typed_dict_shape(tp) -> FullShape:
     else:
         requirement_determinant = _make_requirement_determinant_from_type(tp)
 
+    # a single pass over the hints resolves the requirement of every field
+    # once and feeds input fields, params and output fields together
+    input_fields = []
+    params = []
+    output_fields = []
+    for name, field_tp in type_hints:
+        is_required = requirement_determinant(name)
+        input_fields.append(
+            InputField(
+                type=field_tp,
+                id=name,
+                default=NO_DEFAULT,
+                is_required=is_required,
+                metadata=EMPTY_METADATA,
+                original=None,
+            ),
+        )
+        params.append(
+            Param(
+                field_id=name,
+                name=name,
+                kind=ParamKind.KW_ONLY,
+            ),
+        )
+        output_fields.append(
+            OutputField(
+                type=field_tp,
+                id=name,
+                default=NO_DEFAULT,
+                accessor=create_key_accessor(
+                    key=name,
+                    access_error=None if is_required else KeyError,
+                ),
+                metadata=EMPTY_METADATA,
+                original=None,
+            ),
+        )
+
     return Shape(
         input=InputShape(
             constructor=tp,
-            fields=tuple(
-                InputField(
-                    type=tp,
-                    id=name,
-                    default=NoDefault(),
-                    is_required=requirement_determinant(name),
-                    metadata=MappingProxyType({}),
-                    original=None,
-                )
-                for name, tp in type_hints
-            ),
-            params=tuple(
-                Param(
-                    field_id=name,
-                    name=name,
-                    kind=ParamKind.KW_ONLY,
-                )
-                for name, tp in type_hints
-            ),
+            fields=tuple(input_fields),
+            params=tuple(params),
             kwargs=None,
-            overriden_types=frozenset({}),
+            overriden_types=frozenset(),
         ),
         output=OutputShape(
-            fields=tuple(
-                OutputField(
-                    type=tp,
-                    id=name,
-                    default=NoDefault(),
-                    accessor=create_key_accessor(
-                        key=name,
-                        access_error=None if requirement_determinant(name) else KeyError,
-                    ),
-                    metadata=MappingProxyType({}),
-                    original=None,
-                )
-                for name, tp in type_hints
-            ),
-            overriden_types=frozenset({}),
+            fields=tuple(output_fields),
+            overriden_types=frozenset(),
         ),
     )
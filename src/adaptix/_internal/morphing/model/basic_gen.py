@@ -17,9 +17,9 @@ from typing import (
     Union,
 )
 
+from ...code_tools.cascade_namespace import CascadeNamespace
 from ...code_tools.code_builder import CodeBuilder
 from ...code_tools.compiler import ClosureCompiler
-from ...code_tools.utils import get_literal_expr
 from ...model_tools.definitions import InputField, OutputField
 from ...provider.essential import CannotProvide, Mediator
 from ...provider.request_cls import LocatedRequest, LocStack
@@ -32,14 +32,8 @@ from .crown_definitions import (
     BaseNameLayout,
     BaseNoneCrown,
     BaseShape,
-    ExtraCollect,
     ExtraTargets,
-    InpCrown,
-    InpDictCrown,
     InpExtraMove,
-    InpFieldCrown,
-    InpListCrown,
-    InpNoneCrown,
     OutExtraMove,
 )
 
@@ -203,27 +197,21 @@ def get_wild_extra_targets(shape: BaseShape, extra_move: Union[InpExtraMove, Out
 def compile_closure_with_globals_capturing(
     compiler: ClosureCompiler,
     code_gen_hook: CodeGenHook,
-    namespace: Mapping[str, object],
+    namespace: CascadeNamespace,
     *,
     closure_name: str,
     closure_code: str,
     file_name: str,
 ):
-    builder = CodeBuilder()
+    # every captured value is placed into the globals dict of the generated
+    # module under its own name, so the code binds it via LOAD_GLOBAL
+    # and the per-name aliasing prologue disappears together
+    # with the closure cells it used to create
+    global_namespace_dict = dict(namespace.outer_constants)
+    global_namespace_dict.update(namespace.constants)
 
-    global_namespace_dict = {}
-    for name, value in namespace.items():
-        value_literal = get_literal_expr(value)
-        if value_literal is None:
-            global_name = f"g_{name}"
-            global_namespace_dict[global_name] = value
-            builder += f"{name} = {global_name}"
-        else:
-            builder += f"{name} = {value_literal}"
-
-    builder.empty_line()
+    builder = CodeBuilder()
     builder += closure_code
-    builder += f"return {closure_name}"
 
     code_gen_hook(
         CodeGenHookData(
@@ -237,32 +225,17 @@ def compile_closure_with_globals_capturing(
         lambda uid: f"<adaptix generated {uid}>",
         builder,
         global_namespace_dict,
+        closure_name,
     )
 
 
-def has_collect_policy(crown: InpCrown) -> bool:
-    if isinstance(crown, InpDictCrown):
-        return crown.extra_policy == ExtraCollect() or any(
-            has_collect_policy(sub_crown)
-            for sub_crown in crown.map.values()
-        )
-    if isinstance(crown, InpListCrown):
-        return any(
-            has_collect_policy(sub_crown)
-            for sub_crown in crown.map
-        )
-    if isinstance(crown, (InpFieldCrown, InpNoneCrown)):
-        return False
-    raise TypeError
-
-
 class ModelLoaderGen(ABC):
     @abstractmethod
-    def produce_code(self, closure_name: str) -> Tuple[str, Mapping[str, object]]:
+    def produce_code(self, closure_name: str) -> Tuple[str, CascadeNamespace]:
         ...
 
 
 class ModelDumperGen(ABC):
     @abstractmethod
-    def produce_code(self, closure_name: str) -> Tuple[str, Mapping[str, object]]:
+    def produce_code(self, closure_name: str) -> Tuple[str, CascadeNamespace]:
         ...
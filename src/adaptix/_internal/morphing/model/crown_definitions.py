@@ -1,4 +1,4 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import Any, Callable, Dict, Generic, Mapping, Sequence, TypeVar, Union
 
 from ...common import VarTuple
@@ -175,10 +175,32 @@ class BaseNameLayoutRequest(LocatedRequest[T], Generic[T]):
     shape: BaseShape
 
 
+def _crown_has_collect_policy(crown: InpCrown) -> bool:
+    if isinstance(crown, InpDictCrown):
+        return crown.extra_policy == ExtraCollect() or any(
+            _crown_has_collect_policy(sub_crown)
+            for sub_crown in crown.map.values()
+        )
+    if isinstance(crown, InpListCrown):
+        return any(
+            _crown_has_collect_policy(sub_crown)
+            for sub_crown in crown.map
+        )
+    if isinstance(crown, (InpFieldCrown, InpNoneCrown)):
+        return False
+    raise TypeError
+
+
 @dataclass(frozen=True)
 class InputNameLayout(BaseNameLayout):
     crown: BranchInpCrown
     extra_move: InpExtraMove
+    has_collect_policy: bool = field(init=False, hash=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # the flag is computed once at construction,
+        # so consumers do not walk the crown tree on every check
+        super().__setattr__("has_collect_policy", _crown_has_collect_policy(self.crown))
 
 
 @dataclass(frozen=True)
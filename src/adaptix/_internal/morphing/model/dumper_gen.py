@@ -114,7 +114,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
         self._id_to_field: Dict[str, OutputField] = {field.id: field for field in self._shape.fields}
         self._model_identity = model_identity
 
-    def produce_code(self, closure_name: str) -> Tuple[str, Mapping[str, object]]:
+    def produce_code(self, closure_name: str) -> Tuple[str, CascadeNamespace]:
         body_builder = CodeBuilder()
 
         namespace = BuiltinCascadeNamespace()
@@ -163,7 +163,7 @@ class BuiltinModelDumperGen(ModelDumperGen):
         builder = CodeBuilder()
         with builder(f"def {closure_name}(data):"):
             builder.extend(body_builder)
-        return builder.string(), namespace.all_constants
+        return builder.string(), namespace
 
     def _is_extra_target(self, field: OutputField) -> bool:
         return field.id in self._extra_targets
@@ -1,7 +1,8 @@
 import collections.abc
 import contextlib
-from dataclasses import dataclass
-from typing import AbstractSet, Dict, List, Mapping, Optional, Set, Tuple
+import sys
+from dataclasses import dataclass, fields as dc_fields, is_dataclass
+from typing import AbstractSet, Any, Callable, Dict, List, Mapping, Optional, Set, Tuple
 
 from ...code_tools.cascade_namespace import BuiltinCascadeNamespace, CascadeNamespace
 from ...code_tools.code_builder import CodeBuilder
@@ -41,7 +42,42 @@ from .crown_definitions import (
 )
 
 
+# policy singletons are hoisted so dispatching on them
+# is a plain identity check instead of a call plus rich comparison
+_EXTRA_FORBID = ExtraForbid()
+_EXTRA_COLLECT = ExtraCollect()
+_EXTRA_KWARGS = ExtraKwargs()
+
+# trail helpers and error classes are shared between all loaders
+# and only touched on failure paths,
+# so they are bound as plain globals instead of closure cells;
+# the table is built once instead of resolving __name__ per generation
+_OUTER_CONSTANTS: Mapping[str, object] = {
+    "append_trail": append_trail,
+    "extend_trail": extend_trail,
+    "render_trail_as_note": render_trail_as_note,
+    "ExtraFieldsLoadError": ExtraFieldsLoadError,
+    "ExtraItemsLoadError": ExtraItemsLoadError,
+    "NoRequiredFieldsLoadError": NoRequiredFieldsLoadError,
+    "NoRequiredItemsLoadError": NoRequiredItemsLoadError,
+    "TypeLoadError": TypeLoadError,
+    "ExcludedTypeLoadError": ExcludedTypeLoadError,
+    "LoadError": LoadError,
+    "AggregateLoadError": AggregateLoadError,
+    "CompatExceptionGroup": CompatExceptionGroup,
+    "CollectionsMapping": collections.abc.Mapping,
+    "CollectionsSequence": collections.abc.Sequence,
+}
+
+
 class Namer:
+    __slots__ = (
+        "debug_trail", "path_to_suffix", "_path",
+        "_emit_prefix", "_emit_suffix",
+        "v_data", "v_known_keys", "v_required_keys", "v_extra", "v_has_not_found_error",
+        "_trail_prefix", "_trail_suffix",
+    )
+
     def __init__(
         self,
         debug_trail: DebugTrail,
@@ -51,59 +87,92 @@ class Namer:
         self.debug_trail = debug_trail
         self.path_to_suffix = path_to_suffix
         self._path = path
-
-    def _with_path_suffix(self, basis: str) -> str:
-        if not self._path:
-            return basis
-        return basis + "_" + self.path_to_suffix[self._path]
+        # the debug_trail mode never changes for a generator instance,
+        # so the emit shape is specialized once at construction
+        if debug_trail == DebugTrail.ALL:
+            self._emit_prefix = "errors.append("
+            self._emit_suffix = ")"
+        else:
+            self._emit_prefix = "raise "
+            self._emit_suffix = ""
+        self._set_suffixed_names()
+
+    def _set_suffixed_names(self) -> None:
+        # suffixed names are stored as plain attributes recomputed on path
+        # change, so every v_* access during emission is one attribute load
+        suffix = "_" + self.path_to_suffix[self._path] if self._path else ""
+        self.v_data = "data" + suffix
+        self.v_known_keys = "known_keys" + suffix
+        self.v_required_keys = "required_keys" + suffix
+        self.v_extra = "extra" + suffix
+        self.v_has_not_found_error = "has_not_found_error" + suffix
+        self._set_trail_wrapping()
+
+    def _set_trail_wrapping(self) -> None:
+        # debug_trail and path are fixed between path changes,
+        # so with_trail reduces to gluing precomputed fragments
+        if self.debug_trail == DebugTrail.DISABLE or not self._path:
+            self._trail_prefix: Optional[str] = None
+            self._trail_suffix = ""
+        elif len(self._path) == 1:
+            self._trail_prefix = "append_trail("
+            self._trail_suffix = f", {self._path[0]!r})"
+        else:
+            self._trail_prefix = "extend_trail("
+            self._trail_suffix = f", {self._path!r})"
 
     @property
     def path(self) -> CrownPath:
         return self._path
 
-    @property
-    def v_data(self) -> str:
-        return self._with_path_suffix("data")
+    def with_trail(self, error_expr: str) -> str:
+        if self._trail_prefix is None:
+            return error_expr
+        return self._trail_prefix + error_expr + self._trail_suffix
 
-    @property
-    def v_known_keys(self) -> str:
-        return self._with_path_suffix("known_keys")
+    def emit_error(self, error_expr: str) -> str:
+        return self._emit_prefix + self.with_trail(error_expr) + self._emit_suffix
 
-    @property
-    def v_required_keys(self) -> str:
-        return self._with_path_suffix("required_keys")
 
-    @property
-    def v_extra(self) -> str:
-        return self._with_path_suffix("extra")
+class _AddedKey:
+    """Plain push/pop guard for GenState.add_key,
+    cheaper than a generator-based context manager for this tiny body.
+    """
 
-    @property
-    def v_has_not_found_error(self) -> str:
-        return self._with_path_suffix("has_not_found_error")
+    __slots__ = ("_state", "_past_path", "_past_parent")
 
-    def with_trail(self, error_expr: str) -> str:
-        if self.debug_trail in (DebugTrail.FIRST, DebugTrail.ALL):
-            if len(self._path) == 0:
-                return error_expr
-            if len(self._path) == 1:
-                return f"append_trail({error_expr}, {self._path[0]!r})"
-            return f"extend_trail({error_expr}, {self._path!r})"
-        return error_expr
+    def __init__(self, state: "GenState", past_path: CrownPath, past_parent: Optional[CrownPath]):
+        self._state = state
+        self._past_path = past_path
+        self._past_parent = past_parent
 
-    def emit_error(self, error_expr: str) -> str:
-        if self.debug_trail == DebugTrail.ALL:
-            return f"errors.append({self.with_trail(error_expr)})"
-        return f"raise {self.with_trail(error_expr)}"
+    def __enter__(self) -> None:
+        pass
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        state = self._state
+        state._crown_stack.pop(-1)
+        state._path = self._past_path
+        state._parent_path = self._past_parent
+        state._set_suffixed_names()
 
 
 class GenState(Namer):
+    # attribute loads on the state dominate the emission loop,
+    # slots turn each of them into a fixed-offset access
+    __slots__ = (
+        "builder", "namespace", "_name_to_field", "field_id_to_path",
+        "_last_path_idx", "_parent_path", "_crown_stack",
+        "type_checked_type_paths", "length_checked_paths", "_parent_namers",
+    )
+
     path_to_suffix: Dict[CrownPath, str]
 
     def __init__(
         self,
         builder: CodeBuilder,
         namespace: CascadeNamespace,
-        name_to_field: Dict[str, InputField],
+        name_to_field: Mapping[str, InputField],
         debug_trail: DebugTrail,
         root_crown: InpCrown,
     ):
@@ -118,11 +187,19 @@ class GenState(Namer):
         self._crown_stack: List[InpCrown] = [root_crown]
 
         self.type_checked_type_paths: Set[CrownPath] = set()
+        self.length_checked_paths: Set[CrownPath] = set()
+        self._parent_namers: Dict[CrownPath, Namer] = {}
         super().__init__(debug_trail=debug_trail, path_to_suffix={}, path=())
 
     @property
     def parent(self) -> Namer:
-        return Namer(self.debug_trail, self.path_to_suffix, self.parent_path)
+        parent_path = self.parent_path
+        try:
+            return self._parent_namers[parent_path]
+        except KeyError:
+            namer = Namer(self.debug_trail, self.path_to_suffix, parent_path)
+            self._parent_namers[parent_path] = namer
+            return namer
 
     def v_field_loader(self, field_id: str) -> str:
         return f"loader_{field_id}"
@@ -143,8 +220,7 @@ class GenState(Namer):
     def parent_crown(self) -> BranchInpCrown:
         return self._crown_stack[-2]  # type: ignore[return-value]
 
-    @contextlib.contextmanager
-    def add_key(self, crown: InpCrown, key: CrownPathElem):
+    def add_key(self, crown: InpCrown, key: CrownPathElem) -> "_AddedKey":
         past = self._path
         past_parent = self._parent_path
 
@@ -153,10 +229,8 @@ class GenState(Namer):
         self._crown_stack.append(crown)
         self._last_path_idx += 1
         self.path_to_suffix[self._path] = str(self._last_path_idx)
-        yield
-        self._crown_stack.pop(-1)
-        self._path = past
-        self._parent_path = past_parent
+        self._set_suffixed_names()
+        return _AddedKey(self, past, past_parent)
 
     def get_field(self, crown: InpFieldCrown) -> InputField:
         self.field_id_to_path[crown.id] = self._path
@@ -184,14 +258,15 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         skipped_fields: AbstractSet[str],
         model_identity: str,
         props: ModelLoaderProps,
+        emit_header_comments: bool = False,
     ):
         self._shape = shape
         self._name_layout = name_layout
         self._debug_trail = debug_trail
         self._strict_coercion = strict_coercion
-        self._id_to_field: Dict[str, InputField] = {
-            field.id: field for field in self._shape.fields
-        }
+        # the shape already maintains a precomputed id table,
+        # so there is no need to rebuild it for every codegen run
+        self._id_to_field: Mapping[str, InputField] = shape.fields_dict
         self._field_id_to_param: Dict[str, Param] = {
             param.field_id: param for param in self._shape.params
         }
@@ -199,17 +274,33 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         self._skipped_fields = skipped_fields
         self._model_identity = model_identity
         self._props = props
+        self._emit_header_comments = emit_header_comments
+        # per-field flags are derived once here,
+        # so code generation does not re-walk the shape on every access
+        self._extra_target_ids = (
+            frozenset(self._name_layout.extra_move.fields)
+            if isinstance(self._name_layout.extra_move, ExtraTargets) else
+            frozenset()
+        )
+        self._packed_field_ids = frozenset(
+            field.id for field in self._shape.fields
+            if self._compute_is_packed_field(field)
+        )
+        # crowns are plain dataclasses, so lowering can dispatch
+        # on the exact type instead of an isinstance chain
+        self._crown_gens: Mapping[type, Callable[[GenState, Any], None]] = {
+            InpDictCrown: self._gen_dict_crown,
+            InpListCrown: self._gen_list_crown,
+            InpFieldCrown: self._gen_field_crown,
+            InpNoneCrown: self._gen_none_crown,
+        }
 
     @property
     def _can_collect_extra(self) -> bool:
         return self._name_layout.extra_move is not None
 
     def _is_extra_target(self, field: InputField) -> bool:
-        return (
-            isinstance(self._name_layout.extra_move, ExtraTargets)
-            and
-            field.id in self._name_layout.extra_move.fields
-        )
+        return field.id in self._extra_target_ids
 
     def _create_state(self, namespace: CascadeNamespace) -> GenState:
         return GenState(
@@ -221,33 +312,28 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         )
 
     @property
-    def _has_packed_fields(self):
-        return any(self._is_packed_field(fld) for fld in self._shape.fields)
+    def _has_packed_fields(self) -> bool:
+        return bool(self._packed_field_ids)
 
     def _is_packed_field(self, field: InputField) -> bool:
+        return field.id in self._packed_field_ids
+
+    def _compute_is_packed_field(self, field: InputField) -> bool:
         if self._props.use_default_for_omitted and isinstance(field.default, (DefaultValue, DefaultFactory)):
             return False
         return field.is_optional and not self._is_extra_target(field)
 
-    def produce_code(self, closure_name: str) -> Tuple[str, Mapping[str, object]]:
+    def produce_code(self, closure_name: str) -> Tuple[str, CascadeNamespace]:
         namespace = BuiltinCascadeNamespace()
         state = self._create_state(namespace)
 
         for field_id, loader in self._field_loaders.items():
-            state.namespace.add_constant(state.v_field_loader(field_id), loader)
-
-        for named_value in (
-            append_trail, extend_trail, render_trail_as_note,
-            ExtraFieldsLoadError, ExtraItemsLoadError,
-            NoRequiredFieldsLoadError, NoRequiredItemsLoadError,
-            TypeLoadError, ExcludedTypeLoadError,
-            LoadError, AggregateLoadError,
-        ):
-            state.namespace.add_constant(named_value.__name__, named_value)  # type: ignore[attr-defined]
+            if loader is not as_is_stub and get_literal_expr(loader) is None:
+                state.namespace.add_constant(state.v_field_loader(field_id), loader)
+
+        for name, value in _OUTER_CONSTANTS.items():
+            state.namespace.add_outer_constant(name, value)
 
-        state.namespace.add_constant("CompatExceptionGroup", CompatExceptionGroup)
-        state.namespace.add_constant("CollectionsMapping", collections.abc.Mapping)
-        state.namespace.add_constant("CollectionsSequence", collections.abc.Sequence)
         state.namespace.add_constant("sentinel", object())
 
         if self._debug_trail == DebugTrail.ALL:
@@ -281,12 +367,13 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
             state.builder.empty_line()
 
         self._gen_constructor_call(state)
-        self._gen_header(state)
+        if self._emit_header_comments:
+            self._gen_header(state)
 
         builder = CodeBuilder()
         with builder(f"def {closure_name}(data):"):
             builder.extend(state.builder)
-        return builder.string(), namespace.all_constants
+        return builder.string(), namespace
 
     def _gen_header(self, state: GenState):
         header_builder = CodeBuilder()
@@ -306,9 +393,60 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
 
         state.builder.extend_above(header_builder)
 
+    def _can_create_instance_directly(self) -> bool:
+        constructor = self._shape.constructor
+        if not (isinstance(constructor, type) and is_dataclass(constructor)):
+            return False
+        params = constructor.__dataclass_params__  # type: ignore[attr-defined]
+        if not (params.frozen and params.init):
+            return False
+        # the decorator does not overwrite an __init__ defined in the class body,
+        # and params.init stays true for inheritors of a dataclass;
+        # only the exec-generated __init__ (its code is compiled from "<string>")
+        # is known to just assign fields and can be bypassed
+        init_func = constructor.__dict__.get("__init__")
+        init_code = getattr(init_func, "__code__", None)
+        if init_code is None or init_code.co_filename != "<string>":
+            return False
+        if getattr(constructor, "__post_init__", None) is not None:
+            return False
+        if (
+            self._shape.kwargs is not None
+            or self._skipped_fields
+            or self._has_packed_fields
+            or self._name_layout.extra_move is _EXTRA_KWARGS
+        ):
+            return False
+        dataclass_fields = dc_fields(constructor)
+        return (
+            all(fld.init for fld in dataclass_fields)
+            and {param.field_id for param in self._shape.params} == {fld.name for fld in dataclass_fields}
+        )
+
+    def _gen_direct_instance_creation(self, state: GenState) -> None:
+        state.namespace.add_constant("object_new", object.__new__)
+        state.namespace.add_constant("object_setattr", object.__setattr__)
+
+        state.builder += "result = object_new(constructor)"
+        for param in self._shape.params:
+            field = self._shape.fields_dict[param.field_id]
+            state.builder += f"object_setattr(result, {field.id!r}, {state.v_field(field)})"
+
+        if isinstance(self._name_layout.extra_move, ExtraSaturate):
+            state.namespace.add_constant("saturator", self._name_layout.extra_move.func)
+            state.builder += f"saturator(result, {state.v_extra})"
+        state.builder += "return result"
+
     def _gen_constructor_call(self, state: GenState) -> None:
         state.namespace.add_constant("constructor", self._shape.constructor)
 
+        if self._can_create_instance_directly():
+            # generated __init__ of such frozen dataclass only assigns every field
+            # via object.__setattr__, so the loader can do the same
+            # without entering the __init__ frame
+            self._gen_direct_instance_creation(state)
+            return
+
         constructor_builder = CodeBuilder()
         has_skipped_params = False
         with constructor_builder("constructor("):
@@ -335,7 +473,7 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
             if self._has_packed_fields:
                 constructor_builder("**packed_fields,")
 
-            if self._name_layout.extra_move == ExtraKwargs():
+            if self._name_layout.extra_move is _EXTRA_KWARGS:
                 constructor_builder(f"**{state.v_extra},")
 
         constructor_builder += ")"
@@ -361,18 +499,14 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         return True
 
     def _gen_crown_dispatch(self, state: GenState, sub_crown: InpCrown, key: CrownPathElem):
-        with state.add_key(sub_crown, key):
-            if self._gen_root_crown_dispatch(state, sub_crown):
-                return
-            if isinstance(sub_crown, InpFieldCrown):
-                self._gen_field_crown(state, sub_crown)
-                return
-            if isinstance(sub_crown, InpNoneCrown):
-                self._gen_none_crown(state, sub_crown)
-                return
-
+        try:
+            crown_gen = self._crown_gens[type(sub_crown)]
+        except KeyError:
             raise TypeError
 
+        with state.add_key(sub_crown, key):
+            crown_gen(state, sub_crown)
+
     def _gen_raise_bad_type_error(
         self,
         state: GenState,
@@ -404,6 +538,16 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         on_lookup_error: Optional[str] = None,
     ):
         last_path_el = state.path[-1]
+        if (
+            isinstance(last_path_el, int)
+            and on_lookup_error is None
+            and state.parent_path in state.length_checked_paths
+        ):
+            # the parent list already passed its type and length checks,
+            # so the subscript cannot fail
+            state.builder += f"{assign_to} = {state.parent.v_data}[{last_path_el!r}]"
+            return
+
         if isinstance(last_path_el, str):
             lookup_error = "KeyError"
             bad_type_error = "(TypeError, IndexError)"
@@ -489,12 +633,20 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
 
     def _get_dict_crown_required_keys(self, crown: InpDictCrown) -> Set[str]:
         return {
-            key for key, value in crown.map.items()
+            sys.intern(key) for key, value in crown.map.items()
             if not (isinstance(value, InpFieldCrown) and self._id_to_field[value.id].is_optional)
         }
 
+    def _has_branch_sub_crowns(self, crown: InpDictCrown) -> bool:
+        return any(
+            isinstance(sub_crown, (InpDictCrown, InpListCrown))
+            for sub_crown in crown.map.values()
+        )
+
     def _gen_dict_crown(self, state: GenState, crown: InpDictCrown):
-        state.namespace.add_constant(state.v_known_keys, set(crown.map.keys()))
+        # interned keys let the membership tests below take the pointer-equality
+        # fast path against keys produced by json parsers, which intern as well
+        state.namespace.add_constant(state.v_known_keys, frozenset(map(sys.intern, crown.map.keys())))
         state.namespace.add_constant(state.v_required_keys, self._get_dict_crown_required_keys(crown))
 
         if state.path:
@@ -511,23 +663,36 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
                 self._gen_crown_dispatch(state, value, key)
 
             if state.path not in state.type_checked_type_paths:
-                with state.builder(f"if not isinstance({state.v_data}, CollectionsMapping):"):
+                # plain dict is checked by identity of its type
+                # to skip the slow abc isinstance machinery on the common path
+                with state.builder(
+                    f"if type({state.v_data}) is not dict"
+                    f" and not isinstance({state.v_data}, CollectionsMapping):",
+                ):
                     self._gen_raise_bad_type_error(state, f"TypeLoadError(CollectionsMapping, {state.v_data})")
                 state.builder.empty_line()
                 state.type_checked_type_paths.add(state.path)
 
-            if crown.extra_policy == ExtraForbid():
+            if crown.extra_policy is _EXTRA_FORBID:
+                # issuperset bails out at the first unknown key without
+                # allocating anything, so the difference set is only
+                # materialized when the error actually fires
                 state.builder += f"""
-                    {state.v_extra}_set = set({state.v_data}) - {state.v_known_keys}
-                    if {state.v_extra}_set:
+                    if not {state.v_known_keys}.issuperset({state.v_data}):
+                        {state.v_extra}_set = {state.v_data}.keys() - {state.v_known_keys}
                         {state.emit_error(f"ExtraFieldsLoadError({state.v_extra}_set, {state.v_data})")}
                 """
                 state.builder.empty_line()
-            elif crown.extra_policy == ExtraCollect():
-                state.builder += f"""
-                    for key in set({state.v_data}) - {state.v_known_keys}:
-                        {state.v_extra}[key] = {state.v_data}[key]
-                """
+            elif crown.extra_policy is _EXTRA_COLLECT:
+                extra_comprehension = (
+                    f"{{k: {state.v_data}[k] for k in {state.v_data}.keys() - {state.v_known_keys}}}"
+                )
+                if self._has_branch_sub_crowns(crown):
+                    # nested crowns have already placed their extras
+                    # under known keys, so the dicts are disjoint
+                    state.builder += f"{state.v_extra}.update({extra_comprehension})"
+                else:
+                    state.builder += f"{state.v_extra} = {extra_comprehension}"
                 state.builder.empty_line()
 
         if self._can_collect_extra:
@@ -537,45 +702,66 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         with state.builder(f"if type({state.v_data}) is str:"):
             self._gen_raise_bad_type_error(state, f"ExcludedTypeLoadError(CollectionsSequence, str, {state.v_data})")
 
+    def _gen_list_crown_type_check(self, state: GenState) -> None:
+        if state.path in state.type_checked_type_paths:
+            return
+        with state.builder(
+            f"if type({state.v_data}) is not list"
+            f" and not isinstance({state.v_data}, CollectionsSequence):",
+        ):
+            self._gen_raise_bad_type_error(state, f"TypeLoadError(CollectionsSequence, {state.v_data})")
+        state.builder.empty_line()
+        state.type_checked_type_paths.add(state.path)
+
+    def _gen_list_crown_len_checks(self, state: GenState, crown: InpListCrown) -> None:
+        expected_len = len(crown.map)
+        if crown.extra_policy is _EXTRA_FORBID:
+            state.builder += f"""
+                if len({state.v_data}) != {expected_len}:
+                    if len({state.v_data}) < {expected_len}:
+                        {state.emit_error(f"NoRequiredItemsLoadError({expected_len}, {state.v_data})")}
+                    else:
+                        {state.emit_error(f"ExtraItemsLoadError({expected_len}, {state.v_data})")}
+            """
+        else:
+            state.builder += f"""
+                if len({state.v_data}) < {expected_len}:
+                    {state.emit_error(f"NoRequiredItemsLoadError({expected_len}, {state.v_data})")}
+            """
+
     def _gen_list_crown(self, state: GenState, crown: InpListCrown):
         if state.path:
             self._gen_assignment_from_parent_data(state, assign_to=state.v_data)
             state.builder.empty_line()
 
         if self._can_collect_extra:
-            list_literal: list = [
-                {} if isinstance(sub_crown, (InpFieldCrown, InpNoneCrown)) else None
-                for sub_crown in crown.map
-            ]
-            state.builder(f"{state.v_extra} = {list_literal!r}")
+            # [None] * n is a single fast opcode sequence;
+            # fresh dicts are only allocated for leaf positions,
+            # branch positions are filled by their sub-crowns
+            state.builder += f"{state.v_extra} = [None] * {len(crown.map)}"
+            for idx, sub_crown in enumerate(crown.map):
+                if isinstance(sub_crown, (InpFieldCrown, InpNoneCrown)):
+                    state.builder += f"{state.v_extra}[{idx}] = {{}}"
 
         with self._maybe_wrap_with_type_load_error_catching(state):
             if self._strict_coercion:
                 self._gen_forbidden_sequence_check(state)
 
+            if self._debug_trail != DebugTrail.ALL:
+                # errors are raised at the first problem anyway,
+                # so type and length can be validated up front,
+                # turning every item extraction into a straight-line subscript
+                self._gen_list_crown_type_check(state)
+                self._gen_list_crown_len_checks(state, crown)
+                state.length_checked_paths.add(state.path)
+
             for key, value in enumerate(crown.map):
                 self._gen_crown_dispatch(state, value, key)
 
-            if state.path not in state.type_checked_type_paths:
-                with state.builder(f"if not isinstance({state.v_data}, CollectionsSequence):"):
-                    self._gen_raise_bad_type_error(state, f"TypeLoadError(CollectionsSequence, {state.v_data})")
-                state.builder.empty_line()
-                state.type_checked_type_paths.add(state.path)
+            self._gen_list_crown_type_check(state)
 
-            expected_len = len(crown.map)
-            if crown.extra_policy == ExtraForbid():
-                state.builder += f"""
-                    if len({state.v_data}) != {expected_len}:
-                        if len({state.v_data}) < {expected_len}:
-                            {state.emit_error(f"NoRequiredItemsLoadError({expected_len}, {state.v_data})")}
-                        else:
-                            {state.emit_error(f"ExtraItemsLoadError({expected_len}, {state.v_data})")}
-                """
-            else:
-                state.builder += f"""
-                    if len({state.v_data}) < {expected_len}:
-                        {state.emit_error(f"NoRequiredItemsLoadError({expected_len}, {state.v_data})")}
-                """
+            if self._debug_trail == DebugTrail.ALL:
+                self._gen_list_crown_len_checks(state, crown)
 
         if self._can_collect_extra:
             self._gen_add_self_extra_to_parent_extra(state)
@@ -598,17 +784,27 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
     def _gen_field_crown(self, state: GenState, crown: InpFieldCrown):
         field = state.get_field(crown)
         if field.is_required:
-            self._gen_assignment_from_parent_data(
-                state=state,
-                assign_to=state.v_raw_field(field),
-            )
-            with state.builder("else:"):
+            if isinstance(state.path[-1], str) and state.parent_path in state.type_checked_type_paths:
+                self._gen_required_field_extraction_from_mapping(state, field=field)
+            elif isinstance(state.path[-1], int) and state.parent_path in state.length_checked_paths:
                 self._gen_field_assigment(
                     assign_to=state.v_field(field),
                     field_id=field.id,
-                    loader_arg=state.v_raw_field(field),
+                    loader_arg=f"{state.parent.v_data}[{state.path[-1]!r}]",
+                    state=state,
+                )
+            else:
+                self._gen_assignment_from_parent_data(
                     state=state,
+                    assign_to=state.v_raw_field(field),
                 )
+                with state.builder("else:"):
+                    self._gen_field_assigment(
+                        assign_to=state.v_field(field),
+                        field_id=field.id,
+                        loader_arg=state.v_raw_field(field),
+                        state=state,
+                    )
         else:
             if self._is_packed_field(field):
                 param_name = self._field_id_to_param[field.id].name
@@ -641,6 +837,66 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
 
         state.builder.empty_line()
 
+    def _gen_required_field_extraction_from_mapping(
+        self,
+        state: GenState,
+        *,
+        field: InputField,
+    ):
+        # The parent data is already known to be a mapping,
+        # so the sentinel-based lookup replaces the try/except KeyError ladder
+        # keeping the happy path free of exception handling
+        raw_field = state.v_raw_field(field)
+        not_found_error = (
+            "NoRequiredFieldsLoadError("
+            f"{state.parent.v_required_keys} - set({state.parent.v_data}), {state.parent.v_data}"
+            ")"
+        )
+
+        if self._debug_trail == DebugTrail.DISABLE:
+            with state.builder(
+                f"""
+                {raw_field} = {state.parent.v_data}.get({state.path[-1]!r}, sentinel)
+                if {raw_field} is sentinel:
+                """,
+            ):
+                self._gen_required_field_not_found(state, not_found_error)
+            with state.builder("else:"):
+                self._gen_field_assigment(
+                    assign_to=state.v_field(field),
+                    field_id=field.id,
+                    loader_arg=raw_field,
+                    state=state,
+                )
+        else:
+            state.builder(
+                f"""
+                try:
+                    {raw_field} = {state.parent.v_data}.get({state.path[-1]!r}, sentinel)
+                """,
+            )
+            self._gen_unexpected_exc_catching(state)
+            with state.builder("else:"):
+                with state.builder(f"if {raw_field} is sentinel:"):
+                    self._gen_required_field_not_found(state, not_found_error)
+                with state.builder("else:"):
+                    self._gen_field_assigment(
+                        assign_to=state.v_field(field),
+                        field_id=field.id,
+                        loader_arg=raw_field,
+                        state=state,
+                    )
+
+    def _gen_required_field_not_found(self, state: GenState, not_found_error: str):
+        if self._debug_trail != DebugTrail.ALL:
+            state.builder += f"raise {state.parent.with_trail(not_found_error)}"
+        else:
+            state.builder += f"""
+                if not {state.parent.v_has_not_found_error}:
+                    errors.append({state.parent.with_trail(not_found_error)})
+                    {state.parent.v_has_not_found_error} = True
+            """
+
     def _gen_optional_field_extraction_from_mapping(
         self,
         state: GenState,
@@ -650,19 +906,22 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         on_lookup_error: str,
     ):
         if state.parent_path in state.type_checked_type_paths:
-            with state.builder(f"if {state.path[-1]!r} in {state.parent.v_data}:"):
+            # a single .get call replaces the membership test plus subscript,
+            # halving the number of key lookups
+            with state.builder(
+                f"""
+                value = {state.parent.v_data}.get({state.path[-1]!r}, sentinel)
+                if value is sentinel:
+                    {on_lookup_error}
+                else:
+                """,
+            ):
                 self._gen_field_assigment(
                     assign_to=assign_to,
                     field_id=field.id,
-                    loader_arg=f"{state.parent.v_data}[{state.path[-1]!r}]",
+                    loader_arg="value",
                     state=state,
                 )
-            state.builder(
-                f"""
-                else:
-                    {on_lookup_error}
-                """,
-            )
             return
 
         with state.builder(
@@ -726,11 +985,18 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         loader_arg: str,
         state: GenState,
     ):
-        if self._field_loaders[field_id] == as_is_stub:
+        loader = self._field_loaders[field_id]
+        if loader is as_is_stub:
             processing_expr = loader_arg
         else:
-            field_loader = state.v_field_loader(field_id)
-            processing_expr = f"{field_loader}({loader_arg})"
+            literal_expr = get_literal_expr(loader)
+            if literal_expr is not None:
+                # builtin loaders like int or str are baked into the call site,
+                # saving the closure cell lookup on every call
+                processing_expr = f"{literal_expr}({loader_arg})"
+            else:
+                field_loader = state.v_field_loader(field_id)
+                processing_expr = f"{field_loader}({loader_arg})"
 
         if self._debug_trail in (DebugTrail.ALL, DebugTrail.FIRST):
             state.builder(
@@ -754,7 +1020,7 @@ class BuiltinModelLoaderGen(ModelLoaderGen):
         if not isinstance(extra_move, ExtraTargets):
             return
 
-        if self._name_layout.crown.extra_policy == ExtraCollect():
+        if self._name_layout.crown.extra_policy is _EXTRA_COLLECT:
             for target in extra_move.fields:
                 field = self._id_to_field[target]
 
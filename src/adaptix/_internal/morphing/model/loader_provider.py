@@ -21,7 +21,7 @@ from .basic_gen import (
     get_optional_fields_at_list_crown,
     get_skipped_fields,
     get_wild_extra_targets,
-    has_collect_policy,
+    stub_code_gen_hook,
 )
 from .crown_definitions import InputNameLayout, InputNameLayoutRequest
 
@@ -37,27 +37,44 @@ class ModelLoaderProvider(LoaderProvider):
         self._props = props
 
     def _provide_loader(self, mediator: Mediator, request: LoaderRequest) -> Loader:
-        loader_gen = self._fetch_model_loader_gen(mediator, request)
+        strict_coercion = mediator.mandatory_provide(StrictCoercionRequest(loc_stack=request.loc_stack))
+        debug_trail = mediator.mandatory_provide(DebugTrailRequest(loc_stack=request.loc_stack))
+        code_gen_hook = fetch_code_gen_hook(mediator, request.loc_stack)
+        loader_gen = self._fetch_model_loader_gen(
+            mediator,
+            request,
+            strict_coercion=strict_coercion,
+            debug_trail=debug_trail,
+            # header comments only help someone reading the generated source,
+            # so their formatting and compile cost is skipped unless a hook collects it
+            emit_header_comments=code_gen_hook is not stub_code_gen_hook,
+        )
         closure_name = self._get_closure_name(request)
         loader_code, loader_namespace = loader_gen.produce_code(closure_name=closure_name)
         return compile_closure_with_globals_capturing(
             compiler=self._get_compiler(),
-            code_gen_hook=fetch_code_gen_hook(mediator, request.loc_stack),
+            code_gen_hook=code_gen_hook,
             namespace=loader_namespace,
             closure_code=loader_code,
             closure_name=closure_name,
             file_name=self._get_file_name(request),
         )
 
-    def _fetch_model_loader_gen(self, mediator: Mediator, request: LoaderRequest) -> ModelLoaderGen:
+    def _fetch_model_loader_gen(
+        self,
+        mediator: Mediator,
+        request: LoaderRequest,
+        *,
+        strict_coercion: bool,
+        debug_trail: DebugTrail,
+        emit_header_comments: bool = False,
+    ) -> ModelLoaderGen:
         shape = self._fetch_shape(mediator, request)
         name_layout = self._fetch_name_layout(mediator, request, shape)
         skipped_fields = get_skipped_fields(shape, name_layout)
         self._validate_params(shape, name_layout, skipped_fields)
 
         field_loaders = self._fetch_field_loaders(mediator, request, shape)
-        strict_coercion = mediator.mandatory_provide(StrictCoercionRequest(loc_stack=request.loc_stack))
-        debug_trail = mediator.mandatory_provide(DebugTrailRequest(loc_stack=request.loc_stack))
         return self._create_model_loader_gen(
             debug_trail=debug_trail,
             strict_coercion=strict_coercion,
@@ -66,6 +83,7 @@ class ModelLoaderProvider(LoaderProvider):
             field_loaders=field_loaders,
             skipped_fields=skipped_fields,
             model_identity=self._fetch_model_identity(mediator, request, shape, name_layout),
+            emit_header_comments=emit_header_comments,
         )
 
     def _fetch_model_identity(
@@ -87,6 +105,7 @@ class ModelLoaderProvider(LoaderProvider):
         field_loaders: Mapping[str, Loader],
         skipped_fields: AbstractSet[str],
         model_identity: str,
+        emit_header_comments: bool = False,
     ) -> ModelLoaderGen:
         return BuiltinModelLoaderGen(
             shape=shape,
@@ -97,6 +116,7 @@ class ModelLoaderProvider(LoaderProvider):
             skipped_fields=skipped_fields,
             model_identity=model_identity,
             props=self._props,
+            emit_header_comments=emit_header_comments,
         )
 
     def _request_to_view_string(self, request: LoaderRequest) -> str:
@@ -164,7 +184,7 @@ class ModelLoaderProvider(LoaderProvider):
                 f"Required fields {skipped_required_fields} are skipped",
             )
 
-        if name_layout.extra_move is None and has_collect_policy(name_layout.crown):
+        if name_layout.extra_move is None and name_layout.has_collect_policy:
             raise ValueError(
                 "Cannot create loader that collect extra data"
                 " if InputShape does not take extra data",
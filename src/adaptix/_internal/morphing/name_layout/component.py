@@ -4,13 +4,13 @@ from typing import Callable, DefaultDict, Dict, Iterable, List, Mapping, Optiona
 
 from ...common import VarTuple
 from ...model_tools.definitions import (
+    NO_DEFAULT,
     BaseField,
     BaseShape,
     DefaultFactory,
     DefaultFactoryWithSelf,
     DefaultValue,
     InputField,
-    NoDefault,
     OutputField,
 )
 from ...name_style import NameStyle, convert_snake_style
@@ -357,7 +357,7 @@ class BuiltinSievesMaker(SievesMaker):
         for path, leaf in paths_to_leaves.items():
             if isinstance(leaf, OutFieldCrown):
                 field = request.shape.fields_dict[leaf.id]
-                if field.default != NoDefault() and apply_lsc(mediator, request, schema.omit_default, field):
+                if field.default is not NO_DEFAULT and apply_lsc(mediator, request, schema.omit_default, field):
                     result[path] = self._create_sieve(field)
         return result
 
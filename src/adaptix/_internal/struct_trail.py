@@ -1,6 +1,5 @@
-from collections import deque
 from dataclasses import dataclass
-from typing import Any, Reversible, Sequence, TypeVar, Union
+from typing import Any, Iterable, Sequence, TypeVar, Union
 
 from .feature_requirement import HAS_NATIVE_EXC_GROUP
 
@@ -44,13 +43,15 @@ def append_trail(obj: T, trail_element: TrailElement) -> T:
         # noinspection PyProtectedMember
         trail = obj._adaptix_struct_trail  # type: ignore[attr-defined]
     except AttributeError:
-        obj._adaptix_struct_trail = deque([trail_element])  # type: ignore[attr-defined]
+        # trails are short and most of them get a single element,
+        # a tuple is cheaper to allocate and extend than a deque here
+        obj._adaptix_struct_trail = (trail_element,)  # type: ignore[attr-defined]
     else:
-        trail.appendleft(trail_element)
+        obj._adaptix_struct_trail = (trail_element, *trail)  # type: ignore[attr-defined]
     return obj
 
 
-def extend_trail(obj: T, sub_trail: Reversible[TrailElement]) -> T:
+def extend_trail(obj: T, sub_trail: Iterable[TrailElement]) -> T:
     """Extend a trail with a sub trail. Trail stores in special attribute,
     if an object does not allow adding 3rd-party attributes, do nothing.
     Sub path inserting to start (it is built in reverse order)
@@ -59,9 +60,9 @@ def extend_trail(obj: T, sub_trail: Reversible[TrailElement]) -> T:
         # noinspection PyProtectedMember
         trail = obj._adaptix_struct_trail  # type: ignore[attr-defined]
     except AttributeError:
-        obj._adaptix_struct_trail = deque(sub_trail)  # type: ignore[attr-defined]
+        obj._adaptix_struct_trail = tuple(sub_trail)  # type: ignore[attr-defined]
     else:
-        trail.extendleft(reversed(sub_trail))
+        obj._adaptix_struct_trail = (*sub_trail, *trail)  # type: ignore[attr-defined]
     return obj
 
 
@@ -71,7 +72,7 @@ def get_trail(obj: object) -> Trail:
         # noinspection PyProtectedMember
         return obj._adaptix_struct_trail  # type: ignore[attr-defined]
     except AttributeError:
-        return deque()
+        return ()
 
 
 BaseExcT = TypeVar("BaseExcT", bound=BaseException)
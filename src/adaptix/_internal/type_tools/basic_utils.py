@@ -1,6 +1,7 @@
 import types
 import typing
 from typing import Any, Dict, ForwardRef, Generic, NewType, Protocol, TypedDict, TypeVar, Union
+from weakref import WeakKeyDictionary
 
 from ..common import TypeHint, VarTuple
 from ..feature_requirement import HAS_ANNOTATED, HAS_PY_39, HAS_PY_312, HAS_STD_CLASSES_GENERICS
@@ -10,6 +11,10 @@ from .fundamentals import get_generic_args, get_type_vars, strip_alias
 
 def is_subclass_soft(cls, classinfo) -> bool:
     """Acts like builtin issubclass, but returns False instead of rising TypeError"""
+    # most negative answers come from non-class hints,
+    # rejecting them upfront skips raising and unwinding TypeError
+    if not isinstance(cls, type):
+        return False
     try:
         return issubclass(cls, classinfo)
     except TypeError:
@@ -30,24 +35,46 @@ def is_typed_dict_class(tp) -> bool:
     return isinstance(tp, _TYPED_DICT_MCS)
 
 
-_NAMED_TUPLE_METHODS = ("_fields", "_field_defaults", "_make", "_replace", "_asdict")
-
-
-def is_named_tuple_class(tp) -> bool:
+def _is_named_tuple_class(tp) -> bool:
+    # a tuple subclass with a tuple _fields and an _asdict method
+    # can only be a named tuple, probing the other protocol methods
+    # would just repeat the same mro walk
     return (
         is_subclass_soft(tp, tuple)
-        and all(
-            hasattr(tp, attr_name)
-            for attr_name in _NAMED_TUPLE_METHODS
-        )
+        and isinstance(getattr(tp, "_fields", None), tuple)
+        and hasattr(tp, "_asdict")
     )
 
 
+_is_named_tuple_class_cache: "WeakKeyDictionary[Any, bool]" = WeakKeyDictionary()
+
+
+def is_named_tuple_class(tp) -> bool:
+    # weak keys keep the cache from pinning dynamically created classes
+    try:
+        return _is_named_tuple_class_cache[tp]
+    except KeyError:
+        result = _is_named_tuple_class(tp)
+        _is_named_tuple_class_cache[tp] = result
+        return result
+    except TypeError:
+        # unhashable or not weak-referenceable
+        return _is_named_tuple_class(tp)
+
+
+_is_protocol_cache: "WeakKeyDictionary[type, bool]" = WeakKeyDictionary()
+
+
 def is_protocol(tp):
     if not isinstance(tp, type):
         return False
 
-    return Protocol in tp.__bases__
+    try:
+        return _is_protocol_cache[tp]
+    except KeyError:
+        result = any(base is Protocol for base in tp.__bases__)
+        _is_protocol_cache[tp] = result
+        return result
 
 
 def create_union(args: tuple):
@@ -59,7 +86,7 @@ def is_parametrized(tp: TypeHint) -> bool:
 
 
 if HAS_PY_312:
-    def is_user_defined_generic(tp: TypeHint) -> bool:
+    def _is_user_defined_generic(tp: TypeHint) -> bool:
         return (
             bool(get_type_vars(tp))
             and (
@@ -68,13 +95,29 @@ if HAS_PY_312:
             )
         )
 else:
-    def is_user_defined_generic(tp: TypeHint) -> bool:
+    def _is_user_defined_generic(tp: TypeHint) -> bool:
         return (
             bool(get_type_vars(tp))
             and is_subclass_soft(strip_alias(tp), Generic)
         )
 
 
+_is_user_defined_generic_cache: "WeakKeyDictionary[Any, bool]" = WeakKeyDictionary()
+
+
+def is_user_defined_generic(tp: TypeHint) -> bool:
+    # weak keys keep the cache from pinning dynamically created classes
+    try:
+        return _is_user_defined_generic_cache[tp]
+    except KeyError:
+        result = _is_user_defined_generic(tp)
+        _is_user_defined_generic_cache[tp] = result
+        return result
+    except TypeError:
+        # unhashable or not weak-referenceable
+        return _is_user_defined_generic(tp)
+
+
 def is_generic(tp: TypeHint) -> bool:
     """Check if the type could be parameterized"""
     return (
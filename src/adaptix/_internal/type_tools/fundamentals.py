@@ -1,5 +1,7 @@
 import types
-from typing import TypeVar, get_args, get_origin, get_type_hints
+from functools import lru_cache
+from typing import Any, TypeVar, get_args, get_origin, get_type_hints
+from weakref import WeakKeyDictionary
 
 from ..common import TypeHint, VarTuple
 from ..feature_requirement import HAS_ANNOTATED, HAS_SUPPORTED_PYDANTIC_PKG
@@ -19,11 +21,34 @@ else:
         return False
 
 
-def strip_alias(tp: TypeHint) -> TypeHint:
+def _strip_alias(tp: TypeHint) -> TypeHint:
     origin = tp.__pydantic_generic_metadata__["origin"] if is_pydantic_class(tp) else get_origin(tp)
     return tp if origin is None else origin
 
 
+# non-aliases are their own origin, and storing the key as its own value
+# would pin it in the weak dict, so that case is marked with a sentinel
+_SELF_ORIGIN = object()
+
+_strip_alias_cache: "WeakKeyDictionary[Any, Any]" = WeakKeyDictionary()
+
+
+def strip_alias(tp: TypeHint) -> TypeHint:
+    # the set of distinct hints is small compared to the number of queries,
+    # so repeated get_origin dispatch collapses to one cache lookup;
+    # weak keys keep the cache from pinning dynamically created classes
+    try:
+        cached = _strip_alias_cache[tp]
+    except KeyError:
+        origin = _strip_alias(tp)
+        _strip_alias_cache[tp] = _SELF_ORIGIN if origin is tp else origin
+        return origin
+    except TypeError:
+        # unhashable or not weak-referenceable
+        return _strip_alias(tp)
+    return tp if cached is _SELF_ORIGIN else cached
+
+
 def get_type_vars(tp: TypeHint) -> VarTuple[TypeVar]:
     if is_pydantic_class(tp):
         return tp.__pydantic_generic_metadata__["parameters"]
@@ -42,7 +67,26 @@ def get_generic_args(tp: TypeHint) -> VarTuple[TypeHint]:
 
 
 if HAS_ANNOTATED:
-    def get_all_type_hints(obj, globalns=None, localns=None):
+    def _resolve_all_type_hints(obj, globalns=None, localns=None):
         return get_type_hints(obj, globalns, localns, include_extras=True)
 else:
-    get_all_type_hints = get_type_hints
+    _resolve_all_type_hints = get_type_hints
+
+
+# the hints of a self-referential model contain the class itself,
+# so weak keying cannot work (the value would pin the key);
+# the cache is bounded instead to keep old entries from accumulating
+_cached_resolve_type_hints = lru_cache(maxsize=128)(_resolve_all_type_hints)
+
+
+def get_all_type_hints(obj, globalns=None, localns=None):
+    # get_type_hints re-evaluates forward references on every call;
+    # with default namespaces the result depends only on the object,
+    # so it is memoized (callers treat the mapping as read-only)
+    if globalns is not None or localns is not None:
+        return _resolve_all_type_hints(obj, globalns, localns)
+    try:
+        hash(obj)
+    except TypeError:
+        return _resolve_all_type_hints(obj)
+    return _cached_resolve_type_hints(obj)
@@ -648,7 +648,9 @@ class TypeNormalizer:
 
     @_aspect_storage.add
     def _norm_init_var(self, tp, origin, args):
-        if isinstance(origin, InitVar):
+        # InitVar is never subclassed, an exact type check
+        # skips the __instancecheck__ dispatch on this aspect
+        if type(origin) is InitVar:
             # this origin is InitVar[T]
             return _NormType(
                 InitVar,
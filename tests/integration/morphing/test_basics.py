@@ -92,3 +92,35 @@ def test_int_dt_disable(accum):
 
     dumper = retort.get_dumper(ExampleInt)
     assert dumper(ExampleInt(field1=1, field2=1)) == {"field1": 1, "field2": 1}
+
+
+@dataclass(frozen=True)
+class ExampleFrozen:
+    field1: int
+    field2: str = "default"
+
+
+def test_frozen(accum):
+    retort = Retort(recipe=[accum])
+
+    loader = retort.get_loader(ExampleFrozen)
+    assert loader({"field1": 1, "field2": "2"}) == ExampleFrozen(field1=1, field2="2")
+    assert loader({"field1": 1}) == ExampleFrozen(field1=1)
+
+    dumper = retort.get_dumper(ExampleFrozen)
+    assert dumper(ExampleFrozen(field1=1)) == {"field1": 1, "field2": "default"}
+
+
+@dataclass(frozen=True)
+class ExampleFrozenWithPostInit:
+    field1: int
+
+    def __post_init__(self):
+        object.__setattr__(self, "field1", self.field1 * 2)
+
+
+def test_frozen_with_post_init(accum):
+    retort = Retort(recipe=[accum])
+
+    loader = retort.get_loader(ExampleFrozenWithPostInit)
+    assert loader({"field1": 1}) == ExampleFrozenWithPostInit(field1=1)